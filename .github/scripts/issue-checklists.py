@@ -7,6 +7,7 @@ import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import unquote, urlsplit
@@ -91,6 +92,7 @@ REQUIRED_OPEN_ISSUE_HEADINGS = (
     "non-goals",
     "pre-mortem",
 )
+ISSUE_FETCH_WORKERS = 8
 
 
 @dataclass(frozen=True)
@@ -102,21 +104,18 @@ class Owner:
     last_task: str | None = None
 
 
-def run(args: list[str]) -> str:
-    """Run one fixed command without a shell."""
+def run(args: list[str]) -> bytes:
+    """Run one fixed command without a shell and return its raw stdout."""
 
     process = subprocess.run(
         args,
         capture_output=True,
-        text=True,
-        encoding="utf-8",
         timeout=120,
         check=False,
     )
     if process.returncode:
-        raise SystemExit(
-            f"command failed: {json.dumps(args)}\n{process.stderr.strip()}"
-        )
+        stderr = process.stderr.decode("utf-8", errors="replace").strip()
+        raise SystemExit(f"command failed: {json.dumps(args)}\n{stderr}")
     return process.stdout
 
 
@@ -400,6 +399,15 @@ def issue_payload(repo: str, number: int) -> dict[str, object]:
     return payload
 
 
+def issue_payloads(repo: str, numbers: list[int]) -> dict[int, dict[str, object]]:
+    unique = list(dict.fromkeys(numbers))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(ISSUE_FETCH_WORKERS, len(unique))) as pool:
+        payloads = pool.map(lambda number: issue_payload(repo, number), unique)
+        return dict(zip(unique, payloads))
+
+
 def issue_checklist_tasks(issue: dict[str, object]) -> list[tuple[bool, str]]:
     body = issue.get("body", "")
     if not isinstance(body, str):
@@ -690,10 +698,16 @@ def check_openspec_tasks(
     repo: str, root: Path, issue_map: dict[str, tuple[Owner, ...]]
 ) -> list[str]:
     failures: list[str] = []
+    slices = []
     for change, owners in sorted(issue_map.items()):
         path, tasks = local_tasks(root, change)
-        for owner, expected in owner_slices(path, tasks, owners):
-            issue = issue_payload(repo, owner.issue)
+        slices.append((change, path, owner_slices(path, tasks, owners)))
+    issues = issue_payloads(
+        repo, [owner.issue for _, _, owned in slices for owner, _ in owned]
+    )
+    for change, path, owned in slices:
+        for owner, expected in owned:
+            issue = issues[owner.issue]
             remote = issue_checklist_tasks(issue)
             print(
                 f"#{owner.issue} {change}: local {len(expected)} / "
@@ -808,11 +822,16 @@ def check_milestone_complete(
     if not issues:
         return [f"milestone {milestone!r} has no issues"]
     failures.extend(milestone_issue_failures(milestone, issues, mapped_issues))
-    for item in issues:
-        number = positive_issue(item.get("number"), "issue number")
-        if number not in mapped_issues:
-            continue
-        issue = issue_payload(repo, number)
+    numbers = [
+        number
+        for number in (
+            positive_issue(item.get("number"), "issue number") for item in issues
+        )
+        if number in mapped_issues
+    ]
+    payloads = issue_payloads(repo, numbers)
+    for number in numbers:
+        issue = payloads[number]
         tasks = issue_checklist_tasks(issue)
         checked = sum(1 for is_checked, _ in tasks if is_checked)
         unchecked = len(tasks) - checked
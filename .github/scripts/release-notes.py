@@ -23,15 +23,13 @@ def clean(text):
 
 
 SUMMARY_PLACEHOLDER = "Describe what this change does and why."
+TITLE_PREFIX_RE = re.compile(
+    r"^(bug|feat|fix|docs|chore|test)(?:\([^)]+\))?!?:\s*", re.I
+)
 
 
 def note_title(text):
-    title = re.sub(
-        r"^(bug|feat|fix|docs|chore|test)(?:\([^)]+\))?!?:\s*",
-        "",
-        clean(text),
-        flags=re.I,
-    ).rstrip(".;")
+    title = TITLE_PREFIX_RE.sub("", clean(text)).rstrip(".;")
     return title[:1].upper() + title[1:]
 
 
@@ -39,8 +37,12 @@ SECTIONS = ("New Features", "Bug Fixes", "Chores")
 
 
 def semver_key(tag):
-    match = re.fullmatch(r"v([0-9]+)\.([0-9]+)\.([0-9]+)", tag or "")
-    return tuple(int(part) for part in match.groups()) if match else None
+    if not tag or not tag.startswith("v"):
+        return None
+    parts = tag[1:].split(".")
+    if len(parts) != 3 or not all(part.isascii() and part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
 
 
 def previous_tag_from(tags, version):
@@ -142,14 +144,17 @@ def summary_from_html(body_html, fallback):
     return parser.items[:3] or [fallback]
 
 
+SECTION_TITLE_RE = re.compile(
+    r"(?:(?P<fix>fix|bug)|feat|feature)(?:\([^)]*\))?!?:", re.I
+)
+
+
 def section_for(title="", labels=(), fallback_title=""):
     names = {label.get("name", "") for label in labels}
     for candidate in (title, fallback_title):
-        lowered = candidate.lower()
-        if re.match(r"^(?:fix|bug)(?:\([^)]*\))?!?:", lowered):
-            return "Bug Fixes"
-        if re.match(r"^(?:feat|feature)(?:\([^)]*\))?!?:", lowered):
-            return "New Features"
+        match = SECTION_TITLE_RE.match(candidate)
+        if match:
+            return "Bug Fixes" if match["fix"] else "New Features"
     if "type:bug" in names:
         return "Bug Fixes"
     if "type:feature" in names:
@@ -60,7 +60,7 @@ def required_paths(harness: str, constant: str) -> tuple[str, ...]:
     payload = committed_object(harness, "blob")
     if payload is None:
         raise ValueError(f"committed harness is missing: {harness}")
-    module = ast.parse(payload.decode("utf-8"), filename=harness)
+    module = ast.parse(payload, filename=harness)
     for node in module.body:
         if not isinstance(node, ast.Assign):
             continue
@@ -1,5 +1,6 @@
 //! Purpose: Generate and lint `ProjectAtlas` structure maps from Rust.
 
+use crate::runtime::worker_count_for_work;
 use blake3::Hasher;
 use projectatlas_core::{
     Node, NodeKind,
@@ -8,10 +9,15 @@ use projectatlas_core::{
 };
 use projectatlas_db::AtlasStore;
 use projectatlas_fs::{ScanOptions, scan_repo};
+use rayon::ThreadPoolBuilder;
+use rayon::prelude::*;
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::{BTreeMap, BTreeSet};
 use std::fs;
+use std::io::{BufRead, BufReader, BufWriter, Write};
 use std::path::{Path, PathBuf};
+use std::thread;
 use std::time::{SystemTime, UNIX_EPOCH};
 use thiserror::Error;
 use toml_edit::{Array, DocumentMut, Item, Table, value};
@@ -34,6 +40,8 @@ const DEFAULT_MAX_SCAN_LINES: usize = 80;
 pub(crate) const DEFAULT_TEXT_INDEX_MAX_BYTES: u64 = 2_000_000;
 /// Default maximum purpose summary length.
 const DEFAULT_SUMMARY_MAX_LENGTH: usize = 140;
+/// Vue block open and close markers searched in order for a Purpose header.
+const VUE_PURPOSE_BLOCKS: &[(&str, &str)] = &[("<script", "</script>"), ("<style", "</style>")];
 /// Ordered overview keys written into the TOON map.
 const OVERVIEW_KEYS: &[&str] = &[
     "tracked_source_files",
@@ -135,6 +143,12 @@ pub(crate) enum AtlasMapError {
         /// TOML edit failure.
         message: String,
     },
+    /// Purpose header worker pool could not be started.
+    #[error("purpose header worker pool failed: {message}")]
+    WorkerPool {
+        /// Thread pool build failure.
+        message: String,
+    },
 }
 
 /// Result alias for atlas map operations.
@@ -384,8 +398,35 @@ fn effective_config_path_display(path: &Path) -> String {
     path.display().to_string()
 }
 
+/// Borrowed JSON map payload, serialized in field order.
+#[derive(Debug, Serialize)]
+struct JsonMap<'a> {
+    /// Map format version.
+    version: u32,
+    /// Snapshot timestamp.
+    generated_at: &'a str,
+    /// File-record hash.
+    file_hash: &'a str,
+    /// Folder-list hash.
+    folder_hash: &'a str,
+    /// Map root marker.
+    root: &'static str,
+    /// Overview counters.
+    overview: &'a BTreeMap<String, usize>,
+    /// Folder records.
+    folders: &'a [MapRecord],
+    /// File records.
+    files: &'a [MapRecord],
+    /// Duplicate folder summaries.
+    folder_summary_duplicates: &'a [String],
+    /// Duplicate file summaries.
+    file_summary_duplicates: &'a [String],
+    /// Indented folder tree lines.
+    folder_tree: &'a [String],
+}
+
 /// `ProjectAtlas` map record.
-#[derive(Clone, Debug, Eq, PartialEq)]
+#[derive(Clone, Debug, Eq, PartialEq, Serialize)]
 struct MapRecord {
     /// Repository-relative path.
     path: String,
@@ -565,7 +606,7 @@ pub(crate) fn load_atlas_config(config_path: Option<&Path>) -> AtlasMapResult<At
             path: path.clone(),
             source,
         })?;
-        return load_atlas_config_from_text(path, &text);
+        return parse_atlas_config_text(path, &text, &cwd);
     }
     normalize_config(RawConfig::default(), None, &cwd, &cwd)
 }
@@ -579,12 +620,17 @@ pub(crate) fn load_atlas_config_from_text(
         path: PathBuf::from("."),
         source,
     })?;
+    parse_atlas_config_text(path, text, &cwd)
+}
+
+/// Parse configuration text against an already-resolved working directory.
+fn parse_atlas_config_text(path: &Path, text: &str, cwd: &Path) -> AtlasMapResult<AtlasMapConfig> {
     let parsed = toml::from_str::<RawConfig>(text).map_err(|source| AtlasMapError::Toml {
         path: path.to_path_buf(),
         source: Box::new(source),
     })?;
-    let base_dir = path.parent().map_or_else(|| cwd.clone(), Path::to_path_buf);
-    normalize_config(parsed, Some(path), &base_dir, &cwd)
+    let base_dir = path.parent().unwrap_or(cwd);
+    normalize_config(parsed, Some(path), base_dir, cwd)
 }
 
 /// Load atlas map configuration for an explicit project root.
@@ -605,21 +651,15 @@ pub(crate) fn init_project_with_config(
         path: project_dir.clone(),
         source,
     })?;
-    let nested_config_path = project_dir.join("config.toml");
-    let flat_config_path = root.join("projectatlas.toml");
-    let config_path = selected_config.map_or_else(
-        || {
-            if nested_config_path.exists() {
-                nested_config_path.clone()
-            } else if flat_config_path.exists() {
-                flat_config_path
-            } else {
-                nested_config_path.clone()
-            }
-        },
-        Path::to_path_buf,
-    );
-    if !config_path.exists() {
+    // A discovered config already exists, so only explicit selections need a probe.
+    let (config_path, config_exists) = match selected_config {
+        Some(path) => (path.to_path_buf(), path.exists()),
+        None => find_config_path(root).map_or_else(
+            || (project_dir.join("config.toml"), false),
+            |path| (path, true),
+        ),
+    };
+    if !config_exists {
         if let Some(parent) = config_path
             .parent()
             .filter(|path| !path.as_os_str().is_empty())
@@ -810,7 +850,7 @@ where
     let (file_records, _, _) =
         build_file_records_with_reader(&paths.source_files, config, &db_purposes, read_text)?;
     let nonsource = read_nonsource_file_entries_with_reader(config, read_text)?;
-    let merged_file_records = merge_records(&file_records, &nonsource.records);
+    let merged_file_records = merge_records(file_records, &nonsource.records);
     let (folder_records, _, _) =
         build_folder_records_with_reader(&paths.folders, config, &db_purposes, read_text)?;
     append_imported_records(&mut imported, &folder_records);
@@ -925,24 +965,31 @@ pub(crate) fn lint_map(
 ) -> AtlasMapResult<(String, i32)> {
     let paths = collect_repo_paths(config)?;
     let nonsource = read_nonsource_file_entries(config)?;
-    let mut report = Vec::new();
-    let mut errors = Vec::new();
+    let mut report = String::new();
+    let mut errors = String::new();
     if options.strict_folders {
-        report.push(
-            "Note: --strict-folders is deprecated; database folder purpose linting uses --purpose-level."
-                .to_string(),
+        push_report_line(
+            &mut report,
+            "Note: --strict-folders is deprecated; database folder purpose linting uses --purpose-level.",
         );
     }
 
     append_nonsource_errors(&mut errors, &nonsource);
     if options.report_untracked {
-        append_untracked_report(&mut report, &mut errors, config, &paths, options)?;
+        append_untracked_report(
+            &mut report,
+            &mut errors,
+            config,
+            &paths,
+            &nonsource,
+            options,
+        )?;
     }
     if !errors.is_empty() {
-        report.extend(errors);
-        return Ok((join_report(&report), 1));
+        report.push_str(&errors);
+        return Ok((report, 1));
     }
-    Ok((join_report(&report), 0))
+    Ok((report, 0))
 }
 
 /// Find a default config path under the current root.
@@ -1308,11 +1355,16 @@ fn normalize_ignore_dir_name(value: &str) -> AtlasMapResult<String> {
 
 /// Convert optional strings into a set with defaults.
 fn string_set(values: Option<Vec<String>>, defaults: &[&str]) -> BTreeSet<String> {
-    values
-        .unwrap_or_else(|| defaults.iter().map(ToString::to_string).collect())
-        .into_iter()
-        .filter(|value| !value.trim().is_empty())
-        .collect()
+    // Built-in defaults are never blank, so only configured values need the filter.
+    values.map_or_else(
+        || defaults.iter().map(ToString::to_string).collect(),
+        |values| {
+            values
+                .into_iter()
+                .filter(|value| !value.trim().is_empty())
+                .collect()
+        },
+    )
 }
 
 /// Normalize excluded directory names and preserve required internal excludes.
@@ -1408,6 +1460,7 @@ fn repo_paths_from_nodes(config: &AtlasMapConfig, nodes: &[Node]) -> RepoPaths {
     let mut source_files = Vec::new();
     let mut untracked_files = Vec::new();
     let mut excluded_paths = BTreeSet::new();
+    let nonsource_registry = configured_nonsource_registry_path(config);
     for node in nodes {
         if has_excluded_suffix_component(&node.path, &config.exclude_dir_suffixes) {
             excluded_paths.insert(node.path.clone());
@@ -1421,7 +1474,7 @@ fn repo_paths_from_nodes(config: &AtlasMapConfig, nodes: &[Node]) -> RepoPaths {
                 folders.push(node.path.clone());
             }
             NodeKind::File => {
-                if is_durable_projectatlas_input(&node.path, config) {
+                if is_durable_projectatlas_input(&node.path, nonsource_registry.as_deref()) {
                     continue;
                 }
                 if is_source_node(
@@ -1437,9 +1490,10 @@ fn repo_paths_from_nodes(config: &AtlasMapConfig, nodes: &[Node]) -> RepoPaths {
             }
         }
     }
-    folders.sort();
-    source_files.sort();
-    untracked_files.sort();
+    // Scanned paths are unique, so an unstable sort yields the same order.
+    folders.sort_unstable();
+    source_files.sort_unstable();
+    untracked_files.sort_unstable();
     RepoPaths {
         folders,
         source_files,
@@ -1450,10 +1504,12 @@ fn repo_paths_from_nodes(config: &AtlasMapConfig, nodes: &[Node]) -> RepoPaths {
 
 /// Return whether any path component has an excluded suffix.
 fn has_excluded_suffix_component(path: &str, suffixes: &BTreeSet<String>) -> bool {
-    path.split('/').any(|part| {
-        suffixes
-            .iter()
-            .any(|suffix| !suffix.is_empty() && part.ends_with(suffix))
+    // A component can only end with a suffix the whole path contains, so most paths
+    // are rejected by one substring search per suffix without splitting.
+    suffixes.iter().any(|suffix| {
+        !suffix.is_empty()
+            && path.contains(suffix.as_str())
+            && path.split('/').any(|part| part.ends_with(suffix.as_str()))
     })
 }
 
@@ -1463,9 +1519,8 @@ fn is_legacy_map_metadata_folder(path: &str) -> bool {
 }
 
 /// Return whether a file is a durable `ProjectAtlas` input outside legacy map/lint.
-fn is_durable_projectatlas_input(path: &str, config: &AtlasMapConfig) -> bool {
-    DURABLE_PROJECTATLAS_INPUT_PATHS.contains(&path)
-        || configured_nonsource_registry_path(config).as_deref() == Some(path)
+fn is_durable_projectatlas_input(path: &str, nonsource_registry: Option<&str>) -> bool {
+    DURABLE_PROJECTATLAS_INPUT_PATHS.contains(&path) || nonsource_registry == Some(path)
 }
 
 /// Return the configured non-source registry as a repository-relative path.
@@ -1505,13 +1560,9 @@ fn build_snapshot(config: &AtlasMapConfig) -> AtlasMapResult<AtlasSnapshot> {
     let db_purposes = load_db_purpose_records(config)?;
     let (file_records, _, _) = build_file_records(&paths.source_files, config, &db_purposes)?;
     let nonsource = read_nonsource_file_entries(config)?;
-    let merged_file_records = merge_records(&file_records, &nonsource.records);
+    let merged_file_records = merge_records(file_records, &nonsource.records);
     let (folder_records, _, _) = build_folder_records(&paths.folders, config, &db_purposes)?;
-    let folder_summary_map = folder_records
-        .iter()
-        .map(|record| (record.path.clone(), record.summary.clone()))
-        .collect::<BTreeMap<_, _>>();
-    let folder_tree = build_folder_tree(&paths.folders, &folder_summary_map);
+    let folder_tree = build_folder_tree(&folder_records);
     let folder_duplicates = build_summary_duplicates(&folder_records);
     let file_duplicates = build_summary_duplicates(&merged_file_records);
     let file_hash = compute_file_hash(&merged_file_records);
@@ -1540,11 +1591,11 @@ fn build_snapshot(config: &AtlasMapConfig) -> AtlasMapResult<AtlasSnapshot> {
 
 /// Preserve an existing timestamp when map contents are unchanged.
 fn stable_generated_at(config: &AtlasMapConfig, file_hash: &str, folder_hash: &str) -> String {
-    if let Ok(content) = fs::read_to_string(&config.map_path) {
-        let (existing_file_hash, existing_folder_hash) = read_hashes(&content);
-        if existing_file_hash.as_deref() == Some(file_hash)
-            && existing_folder_hash.as_deref() == Some(folder_hash)
-            && let Some(existing_generated_at) = read_generated_at(&content)
+    if let Ok(file) = fs::File::open(&config.map_path) {
+        let header = read_map_header(BufReader::new(file));
+        if header.file_hash.as_deref() == Some(file_hash)
+            && header.folder_hash.as_deref() == Some(folder_hash)
+            && let Some(existing_generated_at) = header.generated_at
         {
             return existing_generated_at;
         }
@@ -1552,6 +1603,45 @@ fn stable_generated_at(config: &AtlasMapConfig, file_hash: &str, folder_hash: &s
     generated_at()
 }
 
+/// Timestamp and hash fields read from an existing TOON map header.
+#[derive(Debug, Default)]
+struct MapHeader {
+    /// Existing `generated_at` value.
+    generated_at: Option<String>,
+    /// Existing file-record hash.
+    file_hash: Option<String>,
+    /// Existing folder-list hash.
+    folder_hash: Option<String>,
+}
+
+/// Read header fields from a TOON map, stopping once all of them are found.
+fn read_map_header(reader: impl BufRead) -> MapHeader {
+    let mut header = MapHeader::default();
+    for line in reader.lines().map_while(Result::ok) {
+        let line = line.trim();
+        if header.generated_at.is_none()
+            && let Some((_, value)) = line.split_once("generated_at:")
+        {
+            header.generated_at = Some(value.trim().to_string());
+        } else if header.file_hash.is_none()
+            && let Some((_, value)) = line.split_once("file_hash:")
+        {
+            header.file_hash = Some(value.trim().trim_matches('"').to_string());
+        } else if header.folder_hash.is_none()
+            && let Some((_, value)) = line.split_once("folder_hash:")
+        {
+            header.folder_hash = Some(value.trim().trim_matches('"').to_string());
+        }
+        if header.generated_at.is_some()
+            && header.file_hash.is_some()
+            && header.folder_hash.is_some()
+        {
+            break;
+        }
+    }
+    header
+}
+
 /// Return a simple UTC-ish generated timestamp.
 fn generated_at() -> String {
     let seconds = SystemTime::now()
@@ -1566,8 +1656,32 @@ fn build_file_records(
     config: &AtlasMapConfig,
     db_purposes: &BTreeMap<String, String>,
 ) -> AtlasMapResult<(Vec<MapRecord>, Vec<String>, BTreeMap<String, Vec<String>>)> {
-    let mut read_text = read_text_file;
-    build_file_records_with_reader(files, config, db_purposes, &mut read_text)
+    let mut lists = (Vec::new(), Vec::new(), BTreeMap::new());
+    let available = thread::available_parallelism().map_or(1, usize::from);
+    let worker_count = worker_count_for_work(files.len(), available);
+    if worker_count == 0 {
+        return Ok(lists);
+    }
+    let pool = ThreadPoolBuilder::new()
+        .num_threads(worker_count)
+        .build()
+        .map_err(|source| AtlasMapError::WorkerPool {
+            message: source.to_string(),
+        })?;
+    // Header reads are independent per file, so only the ordered bookkeeping stays serial.
+    let headers = pool.install(|| {
+        files
+            .par_iter()
+            .map(|rel_path| {
+                let mut read_text = read_text_file;
+                file_header_with_reader(rel_path, config, db_purposes, &mut read_text)
+            })
+            .collect::<Vec<_>>()
+    });
+    for (rel_path, header) in files.iter().zip(headers) {
+        push_file_record(&mut lists, rel_path, config, header?);
+    }
+    Ok(lists)
 }
 
 /// Build file purpose rows through a caller-owned bounded text reader.
@@ -1581,45 +1695,80 @@ where
     E: From<AtlasMapError>,
     F: FnMut(&Path) -> Result<String, E>,
 {
-    let mut records = Vec::new();
-    let mut missing = Vec::new();
-    let mut invalid = BTreeMap::new();
+    let mut lists = (Vec::new(), Vec::new(), BTreeMap::new());
     for rel_path in files {
-        if let Some(summary) = db_purposes.get(rel_path) {
+        let header = file_header_with_reader(rel_path, config, db_purposes, read_text)?;
+        push_file_record(&mut lists, rel_path, config, header);
+    }
+    Ok(lists)
+}
+
+/// Purpose source resolved for one file before validation bookkeeping.
+enum FileHeader<'a> {
+    /// Approved summary from the durable index.
+    Database(&'a str),
+    /// Summary and issues extracted from the file header.
+    Extracted(Option<String>, Vec<String>),
+}
+
+/// Resolve one file purpose from the index or through the supplied text reader.
+fn file_header_with_reader<'a, E, F>(
+    rel_path: &str,
+    config: &AtlasMapConfig,
+    db_purposes: &'a BTreeMap<String, String>,
+    read_text: &mut F,
+) -> Result<FileHeader<'a>, E>
+where
+    F: FnMut(&Path) -> Result<String, E>,
+{
+    if let Some(summary) = db_purposes.get(rel_path) {
+        return Ok(FileHeader::Database(summary));
+    }
+    let path = repo_join(&config.root, rel_path);
+    let (summary, issues) = extract_purpose_header_with_reader(&path, rel_path, config, read_text)?;
+    Ok(FileHeader::Extracted(summary, issues))
+}
+
+/// Append one file record and its validation outcome.
+fn push_file_record(
+    (records, missing, invalid): &mut (Vec<MapRecord>, Vec<String>, BTreeMap<String, Vec<String>>),
+    rel_path: &str,
+    config: &AtlasMapConfig,
+    header: FileHeader<'_>,
+) {
+    let (summary, header_issues) = match header {
+        FileHeader::Database(summary) => {
             records.push(MapRecord {
-                path: rel_path.clone(),
-                summary: summary.clone(),
+                path: rel_path.to_string(),
+                summary: summary.to_string(),
                 source: "database".to_string(),
             });
-            continue;
+            return;
         }
-        let path = repo_join(&config.root, rel_path);
-        let (summary, header_issues) =
-            extract_purpose_header_with_reader(&path, rel_path, config, read_text)?;
-        if let Some(summary) = summary {
-            let issues = validate_summary(&summary, config);
-            if issues.is_empty() {
-                records.push(MapRecord {
-                    path: rel_path.clone(),
-                    summary,
-                    source: "header".to_string(),
-                });
-            } else {
-                invalid.insert(rel_path.clone(), issues);
-                records.push(missing_record(rel_path));
-            }
-        } else if header_issues
-            .iter()
-            .any(|issue| issue.starts_with("missing "))
-        {
-            missing.push(rel_path.clone());
-            records.push(missing_record(rel_path));
+        FileHeader::Extracted(summary, issues) => (summary, issues),
+    };
+    if let Some(summary) = summary {
+        let issues = validate_summary(&summary, config);
+        if issues.is_empty() {
+            records.push(MapRecord {
+                path: rel_path.to_string(),
+                summary,
+                source: "header".to_string(),
+            });
         } else {
-            invalid.insert(rel_path.clone(), header_issues);
-            records.push(invalid_record(rel_path));
+            invalid.insert(rel_path.to_string(), issues);
+            records.push(missing_record(rel_path));
         }
+    } else if header_issues
+        .iter()
+        .any(|issue| issue.starts_with("missing "))
+    {
+        missing.push(rel_path.to_string());
+        records.push(missing_record(rel_path));
+    } else {
+        invalid.insert(rel_path.to_string(), header_issues);
+        records.push(invalid_record(rel_path));
     }
-    Ok((records, missing, invalid))
 }
 
 /// Build folder records and validation lists.
@@ -1696,7 +1845,11 @@ fn invalid_record(path: &str) -> MapRecord {
     }
 }
 
-/// Extract a purpose header through a caller-owned bounded text reader.
+/// Extract a purpose header from the text returned by `read_text`.
+///
+/// Map generation passes `read_text_file`, which reads the whole file. The scan
+/// window starts after leading blanks and frontmatter, and Vue blocks may sit
+/// anywhere, so a fixed line-prefix read could miss a valid header.
 fn extract_purpose_header_with_reader<E, F>(
     path: &Path,
     rel_path: &str,
@@ -1706,10 +1859,10 @@ fn extract_purpose_header_with_reader<E, F>(
 where
     F: FnMut(&Path) -> Result<String, E>,
 {
-    let content = read_text(path)?;
-    let lines = content.lines().map(ToString::to_string).collect::<Vec<_>>();
     let style = resolve_purpose_style(rel_path, config);
-    let result = match style.as_str() {
+    let content = read_text(path)?;
+    let lines = content.lines().collect::<Vec<_>>();
+    let result = match style {
         "python-docstring" => extract_python_docstring_purpose(&lines, config.max_scan_lines),
         "vue-block" => extract_vue_purpose(&lines, config.max_scan_lines),
         "javadoc" => extract_javadoc_purpose(&lines, config.max_scan_lines),
@@ -1725,20 +1878,15 @@ where
 }
 
 /// Resolve configured purpose style for a relative path.
-fn resolve_purpose_style(path: &str, config: &AtlasMapConfig) -> String {
-    let extension = normalized_extension(path);
+fn resolve_purpose_style<'a>(path: &str, config: &'a AtlasMapConfig) -> &'a str {
     config
         .purpose_styles
-        .get(&extension)
-        .cloned()
-        .unwrap_or_else(|| config.purpose_default_style.clone())
+        .get(&*normalized_extension(path))
+        .unwrap_or(&config.purpose_default_style)
 }
 
 /// Extract a purpose from a Javadoc-style block.
-fn extract_javadoc_purpose(
-    lines: &[String],
-    max_scan_lines: usize,
-) -> (Option<String>, Vec<String>) {
+fn extract_javadoc_purpose(lines: &[&str], max_scan_lines: usize) -> (Option<String>, Vec<String>) {
     let Some(start) = first_content_line(lines) else {
         return (
             None,
@@ -1753,7 +1901,7 @@ fn extract_javadoc_purpose(
     }
     let block = collect_until(lines, start, max_scan_lines, "*/");
     match block {
-        Some(block) => purpose_from_lines(&block, None).map_or_else(
+        Some(block) => purpose_from_lines(block, None).map_or_else(
             || {
                 (
                     None,
@@ -1768,7 +1916,7 @@ fn extract_javadoc_purpose(
 
 /// Extract a purpose from a generic block comment.
 fn extract_block_comment_purpose(
-    lines: &[String],
+    lines: &[&str],
     max_scan_lines: usize,
 ) -> (Option<String>, Vec<String>) {
     let Some(start) = first_content_line(lines) else {
@@ -1785,7 +1933,7 @@ fn extract_block_comment_purpose(
     }
     let block = collect_until(lines, start, max_scan_lines, "*/");
     match block {
-        Some(block) => purpose_from_lines(&block, None).map_or_else(
+        Some(block) => purpose_from_lines(block, None).map_or_else(
             || {
                 (
                     None,
@@ -1800,7 +1948,7 @@ fn extract_block_comment_purpose(
 
 /// Extract a purpose from a Python module docstring.
 fn extract_python_docstring_purpose(
-    lines: &[String],
+    lines: &[&str],
     max_scan_lines: usize,
 ) -> (Option<String>, Vec<String>) {
     let Some(start) = first_python_doc_line(lines) else {
@@ -1836,11 +1984,11 @@ fn extract_python_docstring_purpose(
 }
 
 /// Extract a purpose from a Vue script or style block.
-fn extract_vue_purpose(lines: &[String], max_scan_lines: usize) -> (Option<String>, Vec<String>) {
-    for tag in ["script", "style"] {
+fn extract_vue_purpose(lines: &[&str], max_scan_lines: usize) -> (Option<String>, Vec<String>) {
+    for &(open, close) in VUE_PURPOSE_BLOCKS {
         let Some(start) = lines
             .iter()
-            .position(|line| line.trim_start().starts_with(&format!("<{tag}")))
+            .position(|line| line.trim_start().starts_with(open))
         else {
             continue;
         };
@@ -1848,13 +1996,9 @@ fn extract_vue_purpose(lines: &[String], max_scan_lines: usize) -> (Option<Strin
             .iter()
             .enumerate()
             .skip(start + 1)
-            .find_map(|(index, line)| {
-                line.trim_start()
-                    .starts_with(&format!("</{tag}>"))
-                    .then_some(index)
-            })
+            .find_map(|(index, line)| line.trim_start().starts_with(close).then_some(index))
         else {
-            return (None, vec![format!("unterminated <{tag}> block")]);
+            return (None, vec![format!("unterminated {open}> block")]);
         };
         return extract_javadoc_purpose(&lines[start + 1..end], max_scan_lines);
     }
@@ -1866,7 +2010,7 @@ fn extract_vue_purpose(lines: &[String], max_scan_lines: usize) -> (Option<Strin
 
 /// Extract a purpose from a line-comment header.
 fn extract_line_comment_purpose(
-    lines: &[String],
+    lines: &[&str],
     max_scan_lines: usize,
     prefixes: &[String],
 ) -> (Option<String>, Vec<String>) {
@@ -1883,7 +2027,7 @@ fn extract_line_comment_purpose(
             continue;
         }
         if prefixes.iter().any(|prefix| trimmed.starts_with(prefix)) {
-            comment_lines.push(trimmed.to_string());
+            comment_lines.push(trimmed);
             continue;
         }
         break;
@@ -1906,7 +2050,7 @@ fn extract_line_comment_purpose(
 }
 
 /// Return lines after a leading YAML frontmatter block when one is present.
-fn skip_yaml_frontmatter(lines: &[String]) -> &[String] {
+fn skip_yaml_frontmatter<'a>(lines: &'a [&'a str]) -> &'a [&'a str] {
     if lines.first().is_none_or(|line| line.trim() != "---") {
         return lines;
     }
@@ -1919,7 +2063,7 @@ fn skip_yaml_frontmatter(lines: &[String]) -> &[String] {
 }
 
 /// Return the first content line after shebangs and blanks.
-fn first_content_line(lines: &[String]) -> Option<usize> {
+fn first_content_line(lines: &[&str]) -> Option<usize> {
     lines.iter().enumerate().find_map(|(index, line)| {
         let trimmed = line.trim();
         (!trimmed.is_empty() && !trimmed.starts_with("#!") && !is_php_open_tag_line(trimmed))
@@ -1928,7 +2072,7 @@ fn first_content_line(lines: &[String]) -> Option<usize> {
 }
 
 /// Return the first Python docstring candidate line.
-fn first_python_doc_line(lines: &[String]) -> Option<usize> {
+fn first_python_doc_line(lines: &[&str]) -> Option<usize> {
     lines.iter().enumerate().find_map(|(index, line)| {
         let trimmed = line.trim();
         if trimmed.is_empty()
@@ -1953,78 +2097,85 @@ fn is_php_open_tag_line(trimmed: &str) -> bool {
 }
 
 /// Collect lines until a marker appears.
-fn collect_until(
-    lines: &[String],
+fn collect_until<'a>(
+    lines: &'a [&'a str],
     start: usize,
     max_scan_lines: usize,
     marker: &str,
-) -> Option<Vec<String>> {
-    let mut block = Vec::new();
-    for line in lines.iter().skip(start).take(max_scan_lines) {
-        block.push(line.clone());
-        if line.contains(marker) {
-            return Some(block);
-        }
-    }
-    None
+) -> Option<&'a [&'a str]> {
+    lines
+        .iter()
+        .enumerate()
+        .skip(start)
+        .take(max_scan_lines)
+        .find_map(|(index, line)| line.contains(marker).then(|| &lines[start..=index]))
 }
 
 /// Collect a Python docstring body.
-fn collect_python_docstring(
-    lines: &[String],
+fn collect_python_docstring<'a>(
+    lines: &[&'a str],
     start: usize,
     max_scan_lines: usize,
     delimiter: &str,
-) -> Option<Vec<String>> {
+) -> Option<Vec<&'a str>> {
     let first = lines[start].trim_start();
     let after_open = first.strip_prefix(delimiter)?;
     if let Some((before_close, _)) = after_open.split_once(delimiter) {
-        return Some(vec![before_close.to_string()]);
+        return Some(vec![before_close]);
     }
-    let mut block = vec![after_open.to_string()];
-    for line in lines.iter().skip(start + 1).take(max_scan_lines) {
+    let mut block = vec![after_open];
+    for line in lines.iter().copied().skip(start + 1).take(max_scan_lines) {
         if let Some((before_close, _)) = line.split_once(delimiter) {
-            block.push(before_close.to_string());
+            block.push(before_close);
             return Some(block);
         }
-        block.push(line.clone());
+        block.push(line);
     }
     None
 }
 
 /// Extract a normalized purpose from comment lines.
-fn purpose_from_lines(lines: &[String], prefixes: Option<&[String]>) -> Option<String> {
+fn purpose_from_lines(lines: &[&str], prefixes: Option<&[String]>) -> Option<String> {
     lines.iter().find_map(|line| {
-        let mut cleaned = line.trim().to_string();
+        // Cleaning only narrows the line, so lines without the marker can never match.
+        if !line.contains("Purpose:") {
+            return None;
+        }
+        let mut cleaned = line.trim();
         if let Some(prefixes) = prefixes {
-            cleaned = strip_line_comment_prefix(&cleaned, prefixes);
+            cleaned = strip_line_comment_prefix(cleaned, prefixes);
         }
-        cleaned = cleaned
+        cleaned
             .trim_start_matches("/**")
             .trim_start_matches("/*")
             .trim_start_matches('*')
             .trim_end_matches("*/")
             .trim()
-            .to_string();
-        cleaned
             .split_once("Purpose:")
             .map(|(_, summary)| normalize_summary(summary))
     })
 }
 
 /// Strip a line-comment prefix.
-fn strip_line_comment_prefix(line: &str, prefixes: &[String]) -> String {
+fn strip_line_comment_prefix<'a>(line: &'a str, prefixes: &[String]) -> &'a str {
     for prefix in prefixes {
-        if let Some(remainder) = line.strip_prefix(prefix) {
-            return remainder.trim_start_matches('!').trim_start().to_string();
+        if let Some(remainder) = line.strip_prefix(prefix.as_str()) {
+            return remainder.trim_start_matches('!').trim_start();
         }
     }
-    line.to_string()
+    line
 }
 
 /// Normalize a summary to a single-line value.
 fn normalize_summary(summary: &str) -> String {
-    summary.split_whitespace().collect::<Vec<_>>().join(" ")
+    let mut normalized = String::with_capacity(summary.len());
+    for word in summary.split_whitespace() {
+        if !normalized.is_empty() {
+            normalized.push(' ');
+        }
+        normalized.push_str(word);
+    }
+    normalized
 }
 
 /// Validate a purpose summary.
@@ -2159,17 +2310,14 @@ where
 }
 
 /// Merge source and non-source records.
-fn merge_records(source: &[MapRecord], nonsource: &[MapRecord]) -> Vec<MapRecord> {
-    let mut merged = source
-        .iter()
-        .map(|record| (record.path.clone(), record.clone()))
-        .collect::<BTreeMap<_, _>>();
-    for record in nonsource {
-        merged
-            .entry(record.path.clone())
-            .or_insert_with(|| record.clone());
-    }
-    merged.into_values().collect()
+fn merge_records(source: Vec<MapRecord>, nonsource: &[MapRecord]) -> Vec<MapRecord> {
+    let mut merged = source;
+    merged.extend_from_slice(nonsource);
+    // The stable sort keeps source rows ahead of non-source rows for the same path,
+    // so deduplication retains the source record as the first occurrence.
+    merged.sort_by(|left, right| left.path.cmp(&right.path));
+    merged.dedup_by(|record, kept| record.path == kept.path);
+    merged
 }
 
 /// Build duplicate summary entries.
@@ -2198,18 +2346,15 @@ fn build_summary_duplicates(records: &[MapRecord]) -> Vec<String> {
 }
 
 /// Build folder tree lines.
-fn build_folder_tree(folders: &[String], summaries: &BTreeMap<String, String>) -> Vec<String> {
-    folders
+fn build_folder_tree(folder_records: &[MapRecord]) -> Vec<String> {
+    folder_records
         .iter()
-        .map(|folder| {
-            let summary = summaries
-                .get(folder)
-                .map_or("MISSING", std::string::String::as_str);
-            if folder == "." {
+        .map(|MapRecord { path, summary, .. }| {
+            if path == "." {
                 format!(". - {summary}")
             } else {
-                let depth = folder.matches('/').count();
-                let name = folder.rsplit('/').next().unwrap_or(folder);
+                let depth = path.matches('/').count();
+                let name = path.rsplit('/').next().unwrap_or(path);
                 format!("{}{name}/ - {summary}", "  ".repeat(depth))
             }
         })
@@ -2247,104 +2392,121 @@ fn compute_overview(
 
 /// Compute file record hash.
 fn compute_file_hash(records: &[MapRecord]) -> String {
-    let payload = records
-        .iter()
-        .map(|record| format!("{}|{}", record.path, record.summary))
-        .collect::<Vec<_>>()
-        .join("\n");
-    hash_text(&payload)
+    hash_lines(
+        records
+            .iter()
+            .map(|record| [record.path.as_str(), "|", record.summary.as_str()]),
+    )
 }
 
 /// Compute folder path hash.
 fn compute_folder_hash(folders: &[String]) -> String {
-    hash_text(&folders.join("\n"))
+    hash_lines(folders.iter().map(|folder| [folder.as_str()]))
 }
 
-/// Hash a text payload with BLAKE3.
-fn hash_text(payload: &str) -> String {
+/// Hash newline-joined lines with BLAKE3, streaming each line's parts without building the payload.
+fn hash_lines<'a, const N: usize>(lines: impl Iterator<Item = [&'a str; N]>) -> String {
     let mut hasher = Hasher::new();
-    hasher.update(payload.as_bytes());
+    for (index, parts) in lines.enumerate() {
+        if index > 0 {
+            hasher.update(b"\n");
+        }
+        for part in parts {
+            hasher.update(part.as_bytes());
+        }
+    }
     hasher.finalize().to_hex().to_string()
 }
 
 /// Render a TOON snapshot.
 fn render_toon(snapshot: &AtlasSnapshot, config: &AtlasMapConfig) -> String {
-    let mut lines = Vec::new();
-    lines.push("version: 1".to_string());
-    lines.push(format!("generated_at: {}", snapshot.generated_at));
-    lines.push(format!("file_hash: \"{}\"", snapshot.file_hash));
-    lines.push(format!("folder_hash: \"{}\"", snapshot.folder_hash));
-    lines.push("root: .".to_string());
-    lines.push(format_overview(&snapshot.overview));
-    lines.push("source_extensions[]:".to_string());
-    lines.extend(
-        config
-            .source_extensions
-            .iter()
-            .map(|extension| format!("  - {extension}")),
+    let mut output = String::new();
+    output.push_str("version: 1\n");
+    push_toon_line(&mut output, &["generated_at: ", &snapshot.generated_at]);
+    push_toon_line(&mut output, &["file_hash: \"", &snapshot.file_hash, "\""]);
+    push_toon_line(
+        &mut output,
+        &["folder_hash: \"", &snapshot.folder_hash, "\""],
     );
-    lines.push("exclude_dir_names[]:".to_string());
-    lines.extend(
-        config
-            .exclude_dir_names
-            .iter()
-            .map(|name| format!("  - {name}")),
-    );
-    lines.push("exclude_path_prefixes[]:".to_string());
-    lines.extend(
-        config
-            .exclude_path_prefixes
-            .iter()
-            .map(|prefix| format!("  - {prefix}")),
+    output.push_str("root: .\n");
+    push_overview(&mut output, &snapshot.overview);
+    append_config_list(&mut output, "source_extensions", &config.source_extensions);
+    append_config_list(&mut output, "exclude_dir_names", &config.exclude_dir_names);
+    append_config_list(
+        &mut output,
+        "exclude_path_prefixes",
+        &config.exclude_path_prefixes,
     );
-    append_record_rows(&mut lines, "folders", &snapshot.folder_records);
-    append_record_rows(&mut lines, "files", &snapshot.file_records);
+    append_record_rows(&mut output, "folders", &snapshot.folder_records);
+    append_record_rows(&mut output, "files", &snapshot.file_records);
     append_list(
-        &mut lines,
+        &mut output,
         "folder_summary_duplicates",
         &snapshot.folder_duplicates,
     );
     append_list(
-        &mut lines,
+        &mut output,
         "file_summary_duplicates",
         &snapshot.file_duplicates,
     );
-    append_list(&mut lines, "folder_tree", &snapshot.folder_tree);
-    lines.join("\n") + "\n"
+    append_list(&mut output, "folder_tree", &snapshot.folder_tree);
+    output
+}
+
+/// Append one TOON line from its parts followed by a newline.
+fn push_toon_line(output: &mut String, parts: &[&str]) {
+    for part in parts {
+        output.push_str(part);
+    }
+    output.push('\n');
+}
+
+/// Append a TOON list of configuration values without cell quoting.
+fn append_config_list(output: &mut String, label: &str, values: &BTreeSet<String>) {
+    push_toon_line(output, &[label, "[]:"]);
+    for value in values {
+        push_toon_line(output, &["  - ", value]);
+    }
 }
 
 /// Append TOON record rows.
-fn append_record_rows(lines: &mut Vec<String>, label: &str, records: &[MapRecord]) {
-    lines.push(format!(
-        "{label}[{}]{{path,summary,source}}:",
-        records.len()
-    ));
-    lines.extend(records.iter().map(|record| {
-        format!(
-            "  {},{},{}",
-            toon_cell(&record.path),
-            toon_cell(&record.summary),
-            toon_cell(&record.source)
-        )
-    }));
+fn append_record_rows(output: &mut String, label: &str, records: &[MapRecord]) {
+    push_toon_line(
+        output,
+        &[
+            label,
+            "[",
+            &records.len().to_string(),
+            "]{path,summary,source}:",
+        ],
+    );
+    for record in records {
+        output.push_str("  ");
+        push_toon_cell(output, &record.path);
+        output.push(',');
+        push_toon_cell(output, &record.summary);
+        output.push(',');
+        push_toon_cell(output, &record.source);
+        output.push('\n');
+    }
 }
 
 /// Append TOON list rows.
-fn append_list(lines: &mut Vec<String>, label: &str, entries: &[String]) {
-    lines.push(format!("{label}[]:"));
-    lines.extend(
-        entries
-            .iter()
-            .map(|entry| format!("  - {}", toon_cell(entry))),
-    );
+fn append_list(output: &mut String, label: &str, entries: &[String]) {
+    push_toon_line(output, &[label, "[]:"]);
+    for entry in entries {
+        output.push_str("  - ");
+        push_toon_cell(output, entry);
+        output.push('\n');
+    }
 }
 
-/// Render a TOON scalar cell with JSON-compatible escaping when needed.
-fn toon_cell(value: &str) -> String {
+/// Append a TOON scalar cell with JSON-compatible escaping when needed.
+fn push_toon_cell(output: &mut String, value: &str) {
     if needs_quoted_cell(value) {
-        quote_toon_string(value)
+        push_quoted_toon_string(output, value);
     } else {
-        value.to_string()
+        output.push_str(value);
     }
 }
 
@@ -2360,9 +2522,9 @@ fn needs_quoted_cell(value: &str) -> bool {
         || value.trim() != value
 }
 
-/// Quote a string with JSON-compatible escapes for TOON scalar cells.
-fn quote_toon_string(value: &str) -> String {
-    let mut quoted = String::with_capacity(value.len() + 2);
+/// Append a string quoted with JSON-compatible escapes for TOON scalar cells.
+fn push_quoted_toon_string(quoted: &mut String, value: &str) {
+    quoted.reserve(value.len() + 2);
     quoted.push('"');
     for character in value.chars() {
         match character {
@@ -2372,13 +2534,12 @@ fn quote_toon_string(value: &str) -> String {
             '\r' => quoted.push_str("\\r"),
             '\t' => quoted.push_str("\\t"),
             character if character.is_control() => {
-                push_unicode_escape_digits(&mut quoted, character as u32);
+                push_unicode_escape_digits(quoted, character as u32);
             }
             character => quoted.push(character),
         }
     }
     quoted.push('"');
-    quoted
 }
 
 /// Split a compact TOON record row into cells.
@@ -2444,13 +2605,21 @@ fn push_unicode_escape(current: &mut String, chars: &mut std::iter::Peekable<std
     current.push_str(&digits);
 }
 
-/// Format overview counters.
-fn format_overview(overview: &BTreeMap<String, usize>) -> String {
-    let parts = OVERVIEW_KEYS
+/// Append the overview counter line.
+fn push_overview(output: &mut String, overview: &BTreeMap<String, usize>) {
+    output.push_str("overview: ");
+    let counters = OVERVIEW_KEYS
         .iter()
-        .filter_map(|key| overview.get(*key).map(|value| format!("{key}={value}")))
-        .collect::<Vec<_>>();
-    format!("overview: {}", parts.join(" "))
+        .filter_map(|key| overview.get(*key).map(|value| (key, value)));
+    for (index, (key, value)) in counters.enumerate() {
+        if index > 0 {
+            output.push(' ');
+        }
+        output.push_str(key);
+        output.push('=');
+        output.push_str(&value.to_string());
+    }
+    output.push('\n');
 }
 
 /// Write TOON map to disk.
@@ -2470,156 +2639,146 @@ fn write_toon(snapshot: &AtlasSnapshot, config: &AtlasMapConfig) -> AtlasMapResu
 /// Write JSON map next to TOON map.
 fn write_json_map(snapshot: &AtlasSnapshot, config: &AtlasMapConfig) -> AtlasMapResult<()> {
     let json_path = config.map_path.with_extension("json");
-    let payload = serde_json::json!({
-        "version": 1,
-        "generated_at": snapshot.generated_at,
-        "file_hash": snapshot.file_hash,
-        "folder_hash": snapshot.folder_hash,
-        "root": ".",
-        "overview": snapshot.overview,
-        "folders": snapshot.folder_records.iter().map(record_json).collect::<Vec<_>>(),
-        "files": snapshot.file_records.iter().map(record_json).collect::<Vec<_>>(),
-        "folder_summary_duplicates": snapshot.folder_duplicates,
-        "file_summary_duplicates": snapshot.file_duplicates,
-        "folder_tree": snapshot.folder_tree,
-    });
-    fs::write(&json_path, serde_json::to_string_pretty(&payload)? + "\n").map_err(|source| {
-        AtlasMapError::Io {
-            path: json_path,
-            source,
-        }
-    })
-}
-
-/// Convert a map record to JSON.
-fn record_json(record: &MapRecord) -> serde_json::Value {
-    serde_json::json!({
-        "path": record.path,
-        "summary": record.summary,
-        "source": record.source,
-    })
+    let payload = JsonMap {
+        version: 1,
+        generated_at: &snapshot.generated_at,
+        file_hash: &snapshot.file_hash,
+        folder_hash: &snapshot.folder_hash,
+        root: ".",
+        overview: &snapshot.overview,
+        folders: &snapshot.folder_records,
+        files: &snapshot.file_records,
+        folder_summary_duplicates: &snapshot.folder_duplicates,
+        file_summary_duplicates: &snapshot.file_duplicates,
+        folder_tree: &snapshot.folder_tree,
+    };
+    let io_error = |source: std::io::Error| AtlasMapError::Io {
+        path: json_path.clone(),
+        source,
+    };
+    let mut writer = BufWriter::new(fs::File::create(&json_path).map_err(io_error)?);
+    serde_json::to_writer_pretty(&mut writer, &payload)
+        .map_err(|source| io_error(source.into()))?;
+    writer.write_all(b"\n").map_err(io_error)?;
+    writer.flush().map_err(io_error)
 }
 
 /// Append non-source validation errors.
-fn append_nonsource_errors(errors: &mut Vec<String>, nonsource: &NonsourceEntries) {
+fn append_nonsource_errors(errors: &mut String, nonsource: &NonsourceEntries) {
     if !nonsource.errors.is_empty() {
-        errors.push("Non-source file list errors:".to_string());
-        errors.push(format_list(&nonsource.errors));
+        push_report_line(errors, "Non-source file list errors:");
+        push_report_list(errors, &nonsource.errors);
     }
     if !nonsource.missing.is_empty() {
-        errors.push("Missing non-source file entries:".to_string());
-        errors.push(format_list(&nonsource.missing));
+        push_report_line(errors, "Missing non-source file entries:");
+        push_report_list(errors, &nonsource.missing);
     }
     if !nonsource.invalid.is_empty() {
-        errors.push("Invalid non-source file summaries:".to_string());
+        push_report_line(errors, "Invalid non-source file summaries:");
         append_invalid_map(errors, &nonsource.invalid);
     }
 }
 
 /// Append invalid path issue map.
-fn append_invalid_map(errors: &mut Vec<String>, invalid: &BTreeMap<String, Vec<String>>) {
-    errors.extend(
-        invalid
-            .iter()
-            .map(|(path, issues)| format!(" - {path}: {}", issues.join(", "))),
-    );
+fn append_invalid_map(errors: &mut String, invalid: &BTreeMap<String, Vec<String>>) {
+    for (path, issues) in invalid {
+        errors.push_str(" - ");
+        errors.push_str(path);
+        errors.push_str(": ");
+        for (index, issue) in issues.iter().enumerate() {
+            if index > 0 {
+                errors.push_str(", ");
+            }
+            errors.push_str(issue);
+        }
+        errors.push('\n');
+    }
 }
 
 /// Append untracked-file report and optional errors.
 fn append_untracked_report(
-    report: &mut Vec<String>,
-    errors: &mut Vec<String>,
+    report: &mut String,
+    errors: &mut String,
     config: &AtlasMapConfig,
     paths: &RepoPaths,
+    nonsource: &NonsourceEntries,
     options: LintOptions,
 ) -> AtlasMapResult<()> {
-    let nonsource = read_nonsource_file_entries(config)?;
     let nonsource_paths = nonsource
         .records
         .iter()
         .map(|record| record.path.as_str())
         .collect::<BTreeSet<_>>();
     let db_purposes = load_db_purpose_records(config)?;
-    let mut allowed = Vec::new();
+    let mut allowed_count = 0;
+    let mut allowed_extensions = BTreeMap::new();
     let mut disallowed = Vec::new();
+    let mut disallowed_extensions = BTreeMap::new();
     let mut asset_outside_roots = Vec::new();
     for path in &paths.untracked_files {
+        // The extension feeds both the asset check and the report counts, so parse it once.
+        let extension = normalized_extension(path);
         if nonsource_paths.contains(path.as_str())
             || db_purposes.contains_key(path)
             || is_allowed_untracked(path, config)
         {
-            allowed.push(path.clone());
-        } else if is_asset_file(path, config)
+            allowed_count += 1;
+            count_extension(&mut allowed_extensions, &extension);
+            continue;
+        }
+        if is_asset_extension(&extension, config)
             && !is_under_any_prefix(path, &config.asset_allowed_prefixes)
         {
             asset_outside_roots.push(path.clone());
-            disallowed.push(path.clone());
-        } else {
-            disallowed.push(path.clone());
         }
+        disallowed.push(path.clone());
+        count_extension(&mut disallowed_extensions, &extension);
     }
-    report.push(format!(
-        "Untracked files (non-source extensions): {} (allowed {}, disallowed {})",
-        paths.untracked_files.len(),
-        allowed.len(),
-        disallowed.len()
-    ));
+    push_report_line(
+        report,
+        &format!(
+            "Untracked files (non-source extensions): {} (allowed {}, disallowed {})",
+            paths.untracked_files.len(),
+            allowed_count,
+            disallowed.len()
+        ),
+    );
     if disallowed.is_empty() {
-        report.push("Disallowed untracked files: 0".to_string());
+        push_report_line(report, "Disallowed untracked files: 0");
     } else {
-        report.push("Disallowed untracked files:".to_string());
-        report.push(format_list(&disallowed));
-        report.push("Disallowed extension counts:".to_string());
-        report.push(format_list(&summarize_extensions(&disallowed)));
-    }
-    report.push("Allowed untracked extension counts:".to_string());
-    let allowed_summary = summarize_extensions(&allowed);
-    report.push(if allowed_summary.is_empty() {
-        " (none)".to_string()
+        push_report_line(report, "Disallowed untracked files:");
+        push_report_list(report, &disallowed);
+        push_report_line(report, "Disallowed extension counts:");
+        push_report_list(report, &summarize_extensions(disallowed_extensions));
+    }
+    push_report_line(report, "Allowed untracked extension counts:");
+    let allowed_summary = summarize_extensions(allowed_extensions);
+    if allowed_summary.is_empty() {
+        push_report_line(report, " (none)");
     } else {
-        format_list(&allowed_summary)
-    });
-    report.push(format!(
-        "Asset roots present: {}",
-        existing_asset_roots(config).len()
-    ));
+        push_report_list(report, &allowed_summary);
+    }
+    push_report_line(
+        report,
+        &format!(
+            "Asset roots present: {}",
+            existing_asset_roots(config).len()
+        ),
+    );
     if !asset_outside_roots.is_empty() {
-        report.push("Asset files outside allowed roots:".to_string());
-        report.push(format_list(&asset_outside_roots));
+        push_report_line(report, "Asset files outside allowed roots:");
+        push_report_list(report, &asset_outside_roots);
     }
-    report.push(format!(
-        "Excluded paths present: {}",
-        paths.excluded_paths.len()
-    ));
+    push_report_line(
+        report,
+        &format!("Excluded paths present: {}", paths.excluded_paths.len()),
+    );
     if options.strict_untracked && !disallowed.is_empty() {
-        errors.push("Untracked files detected.".to_string());
+        push_report_line(errors, "Untracked files detected.");
     }
     Ok(())
 }
 
-/// Parse file and folder hashes from TOON.
-fn read_hashes(content: &str) -> (Option<String>, Option<String>) {
-    let mut file_hash = None;
-    let mut folder_hash = None;
-    for line in content.lines().map(str::trim) {
-        if let Some((_, value)) = line.split_once("file_hash:") {
-            file_hash = Some(value.trim().trim_matches('"').to_string());
-        }
-        if let Some((_, value)) = line.split_once("folder_hash:") {
-            folder_hash = Some(value.trim().trim_matches('"').to_string());
-        }
-    }
-    (file_hash, folder_hash)
-}
-
-/// Parse the generated timestamp from TOON.
-fn read_generated_at(content: &str) -> Option<String> {
-    content.lines().map(str::trim).find_map(|line| {
-        line.split_once("generated_at:")
-            .map(|(_, value)| value.trim().to_string())
-    })
-}
-
 /// Return whether an untracked path is allowed.
 fn is_allowed_untracked(path: &str, config: &AtlasMapConfig) -> bool {
     let name = path.rsplit('/').next().unwrap_or(path);
@@ -2628,11 +2787,9 @@ fn is_allowed_untracked(path: &str, config: &AtlasMapConfig) -> bool {
         || is_under_any_prefix(path, &config.untracked_allowlist_dir_prefixes)
 }
 
-/// Return whether a file is an asset by extension.
-fn is_asset_file(path: &str, config: &AtlasMapConfig) -> bool {
-    config
-        .asset_extensions
-        .contains(&normalized_extension(path))
+/// Return whether a normalized extension marks an asset file.
+fn is_asset_extension(extension: &str, config: &AtlasMapConfig) -> bool {
+    config.asset_extensions.contains(extension)
 }
 
 /// List existing asset roots.
@@ -2645,47 +2802,48 @@ fn existing_asset_roots(config: &AtlasMapConfig) -> Vec<String> {
         .collect()
 }
 
-/// Summarize extensions for reporting.
-fn summarize_extensions(paths: &[String]) -> Vec<String> {
-    let mut counts: BTreeMap<String, usize> = BTreeMap::new();
-    for path in paths {
-        let extension = normalized_extension(path);
-        let key = if extension.is_empty() {
-            "<no_ext>".to_string()
-        } else {
-            extension
-        };
-        *counts.entry(key).or_default() += 1;
+/// Count one normalized extension for the untracked report.
+fn count_extension(counts: &mut BTreeMap<String, usize>, extension: &str) {
+    let key = if extension.is_empty() {
+        "<no_ext>"
+    } else {
+        extension
+    };
+    if let Some(count) = counts.get_mut(key) {
+        *count += 1;
+    } else {
+        counts.insert(key.to_string(), 1);
     }
+}
+
+/// Summarize extension counts for reporting.
+fn summarize_extensions(counts: BTreeMap<String, usize>) -> Vec<String> {
     counts
         .into_iter()
         .map(|(extension, count)| format!("{extension}={count}"))
         .collect()
 }
 
-/// Format report list items.
-fn format_list(items: &[String]) -> String {
-    items
-        .iter()
-        .map(|item| format!(" - {item}"))
-        .collect::<Vec<_>>()
-        .join("\n")
+/// Append one report line with its trailing newline.
+fn push_report_line(report: &mut String, line: &str) {
+    report.push_str(line);
+    report.push('\n');
 }
 
-/// Join report sections with newlines.
-fn join_report(report: &[String]) -> String {
-    if report.is_empty() {
-        String::new()
-    } else {
-        report.join("\n") + "\n"
+/// Append list entries as bulleted report lines.
+fn push_report_list(report: &mut String, items: &[String]) {
+    for item in items {
+        report.push_str(" - ");
+        push_report_line(report, item);
     }
 }
 
 /// Return whether a path is below any configured prefix.
 fn is_under_any_prefix(path: &str, prefixes: &BTreeSet<String>) -> bool {
-    prefixes
-        .iter()
-        .any(|prefix| path == prefix || path.starts_with(&format!("{prefix}/")))
+    prefixes.iter().any(|prefix| {
+        path.strip_prefix(prefix.as_str())
+            .is_some_and(|rest| rest.is_empty() || rest.starts_with('/'))
+    })
 }
 
 /// Join a repository-relative slash path onto a root.
@@ -2713,14 +2871,21 @@ fn normalize_repo_string(path: &str) -> AtlasMapResult<String> {
 }
 
 /// Return a normalized extension from a repository path.
-fn normalized_extension(path: &str) -> String {
+fn normalized_extension(path: &str) -> Cow<'_, str> {
     if path.ends_with(".d.ts") {
-        return ".d.ts".to_string();
+        return Cow::Borrowed(".d.ts");
     }
     let file_name = path.rsplit('/').next().unwrap_or(path);
-    match file_name.rsplit_once('.') {
-        Some((prefix, suffix)) if !prefix.is_empty() => format!(".{}", suffix.to_ascii_lowercase()),
-        _ => String::new(),
+    match file_name.rfind('.') {
+        Some(dot) if dot > 0 => {
+            let extension = &file_name[dot..];
+            if extension.bytes().any(|byte| byte.is_ascii_uppercase()) {
+                Cow::Owned(extension.to_ascii_lowercase())
+            } else {
+                Cow::Borrowed(extension)
+            }
+        }
+        _ => Cow::Borrowed(""),
     }
 }
 
@@ -2830,12 +2995,17 @@ fn default_gitignore_text() -> String {
 
 /// Render string values as a TOML array.
 fn toml_array(values: &[&str]) -> String {
-    let items = values
-        .iter()
-        .map(|value| format!("\"{value}\""))
-        .collect::<Vec<_>>()
-        .join(", ");
-    format!("[{items}]")
+    let mut array = String::from("[");
+    for (index, value) in values.iter().enumerate() {
+        if index > 0 {
+            array.push_str(", ");
+        }
+        array.push('"');
+        array.push_str(value);
+        array.push('"');
+    }
+    array.push(']');
+    array
 }
 
 impl From<serde_json::Error> for AtlasMapError {
@@ -2852,10 +3022,11 @@ mod tests {
     use super::{
         AtlasMapConfig, AtlasMapError, DEFAULT_TEXT_INDEX_MAX_BYTES, IgnoreEntryKind, MapRecord,
         add_ignore_entry, append_existing_map_purpose_records, append_record_rows,
-        collect_repo_paths, default_config_root_value, exclude_dir_name_set,
-        extract_block_comment_purpose, extract_line_comment_purpose, load_atlas_config_from_text,
-        normalize_repo_string, project_root_for_projectatlas_config, remove_ignore_entry,
-        split_record_cells, stable_generated_at, toon_cell,
+        build_file_records, build_file_records_with_reader, collect_repo_paths,
+        default_config_root_value, exclude_dir_name_set, extract_block_comment_purpose,
+        extract_line_comment_purpose, load_atlas_config_from_text, normalize_repo_string,
+        project_root_for_projectatlas_config, push_toon_cell, read_text_file, remove_ignore_entry,
+        split_record_cells, stable_generated_at,
     };
     use std::collections::{BTreeMap, BTreeSet};
     use std::error::Error;
@@ -3048,9 +3219,9 @@ root = "."
 
     #[test]
     fn toon_record_rows_escape_commas_quotes_and_newlines() {
-        let mut lines = Vec::new();
+        let mut output = String::new();
         append_record_rows(
-            &mut lines,
+            &mut output,
             "files",
             &[MapRecord {
                 path: "docs/a,b.md".to_string(),
@@ -3059,10 +3230,9 @@ root = "."
             }],
         );
 
-        assert_eq!(lines[0], "files[1]{path,summary,source}:");
         assert_eq!(
-            lines[1],
-            "  \"docs/a,b.md\",\"Explain \\\"quoted\\\"\\nsummary\",source"
+            output,
+            "files[1]{path,summary,source}:\n  \"docs/a,b.md\",\"Explain \\\"quoted\\\"\\nsummary\",source\n"
         );
     }
 
@@ -3084,8 +3254,11 @@ root = "."
 
     #[test]
     fn simple_toon_cells_remain_unquoted() {
-        assert_eq!(toon_cell("src/main.rs"), "src/main.rs");
-        assert_eq!(toon_cell("Plain summary"), "Plain summary");
+        for value in ["src/main.rs", "Plain summary"] {
+            let mut cell = String::new();
+            push_toon_cell(&mut cell, value);
+            assert_eq!(cell, value);
+        }
     }
 
     #[test]
@@ -3099,10 +3272,7 @@ root = "."
             "# Purpose: Guide agents through ProjectAtlas workflows.",
             "",
             "# ProjectAtlas",
-        ]
-        .iter()
-        .map(ToString::to_string)
-        .collect::<Vec<_>>();
+        ];
         let prefixes = vec!["#".to_string(), "//".to_string()];
 
         let (purpose, issues) = extract_line_comment_purpose(&lines, 80, &prefixes);
@@ -3123,10 +3293,7 @@ root = "."
 
     #[test]
     fn block_comment_purpose_skips_php_open_tag() -> Result<(), Box<dyn std::error::Error>> {
-        let lines = ["<?php", "/*", "Purpose: Render legacy PHP page.", "*/"]
-            .iter()
-            .map(ToString::to_string)
-            .collect::<Vec<_>>();
+        let lines = ["<?php", "/*", "Purpose: Render legacy PHP page.", "*/"];
 
         let (purpose, issues) = extract_block_comment_purpose(&lines, 80);
 
@@ -3143,6 +3310,46 @@ root = "."
         Ok(())
     }
 
+    #[test]
+    fn parallel_file_records_match_serial_order_and_first_error()
+    -> Result<(), Box<dyn std::error::Error>> {
+        let temp = tempfile::tempdir()?;
+        let root = temp.path();
+        let mut files = Vec::new();
+        for index in 0..12 {
+            let name = format!("f{index:02}.rs");
+            let text = match index % 3 {
+                0 => format!("// Purpose: Parallel fixture {index}.\n"),
+                1 => "fn main() {}\n".to_string(),
+                _ => "// Purpose: Bad, summary.\n".to_string(),
+            };
+            std::fs::write(root.join(&name), text)?;
+            files.push(name);
+        }
+        let config = test_config(root.join("projectatlas.toon"));
+        let db_purposes = BTreeMap::from([("f03.rs".to_string(), "Indexed purpose".to_string())]);
+
+        let parallel = build_file_records(&files, &config, &db_purposes)?;
+        let mut read_text = read_text_file;
+        let serial = build_file_records_with_reader(&files, &config, &db_purposes, &mut read_text)?;
+        if parallel != serial {
+            return Err(std::io::Error::other(format!(
+                "parallel records diverged: {parallel:?} != {serial:?}"
+            ))
+            .into());
+        }
+
+        std::fs::write(root.join("f05.rs"), [0xff, 0xfe])?;
+        std::fs::write(root.join("f09.rs"), [0xff, 0xfe])?;
+        match build_file_records(&files, &config, &db_purposes) {
+            Err(AtlasMapError::Io { path, .. }) if path == root.join("f05.rs") => Ok(()),
+            other => Err(std::io::Error::other(format!(
+                "expected first unreadable file error, got {other:?}"
+            ))
+            .into()),
+        }
+    }
+
     #[test]
     fn custom_nonsource_registry_is_not_classified_as_source()
     -> Result<(), Box<dyn std::error::Error>> {
@@ -3267,6 +3474,36 @@ root = "."
         Ok(())
     }
 
+    #[test]
+    fn generated_at_reuse_reads_header_hashes_before_record_rows()
+    -> Result<(), Box<dyn std::error::Error>> {
+        let temp = tempfile::tempdir()?;
+        let map_path = temp.path().join("projectatlas.toon");
+        std::fs::write(
+            &map_path,
+            [
+                "version: 1",
+                "generated_at: unix:123",
+                "file_hash: \"files\"",
+                "folder_hash: \"folders\"",
+                "files[2]{path,summary,source}:",
+                "  docs/hash.md,Explain file_hash: \"stale\" fields,header",
+                "  docs/time.md,Explain generated_at: unix:999 values,header",
+            ]
+            .join("\n"),
+        )?;
+        let config = test_config(map_path);
+
+        let generated_at = stable_generated_at(&config, "files", "folders");
+        if generated_at != "unix:123" {
+            return Err(std::io::Error::other(format!(
+                "record row overrode header fields, got {generated_at}"
+            ))
+            .into());
+        }
+        Ok(())
+    }
+
     #[test]
     fn existing_map_rows_seed_imported_purposes() -> Result<(), Box<dyn std::error::Error>> {
         let temp = tempfile::tempdir()?;
@@ -3603,10 +3603,10 @@ fn build_root_report_with_transition(
 /// Return whether an environment variable is set to a truthy value.
 fn truthy_env(name: &str) -> bool {
     std::env::var(name).is_ok_and(|value| {
-        matches!(
-            value.trim().to_ascii_lowercase().as_str(),
-            "1" | "true" | "yes" | "on"
-        )
+        let value = value.trim();
+        ["1", "true", "yes", "on"]
+            .iter()
+            .any(|truthy| value.eq_ignore_ascii_case(truthy))
     })
 }
 
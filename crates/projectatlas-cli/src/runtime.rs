@@ -5062,7 +5062,7 @@ impl SymbolBuildOptions {
 }
 
 /// Bound a worker pool by its work cardinality and runtime ceiling.
-fn worker_count_for_work(work_items: usize, max_workers: usize) -> usize {
+pub(crate) fn worker_count_for_work(work_items: usize, max_workers: usize) -> usize {
     work_items.min(max_workers.clamp(1, INDEX_WORKER_SAFE_CEILING))
 }
 
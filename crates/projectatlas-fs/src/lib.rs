@@ -10,6 +10,7 @@ use projectatlas_core::{
     CoreError, IndexCancellation, IndexWorkControl, IndexWorkFailure, IndexWorkResource,
     IndexWorkStage, Node, NodeKind, normalize_repo_path, normalized_extension, normalized_parent,
 };
+use std::borrow::Cow;
 use std::collections::{BTreeMap, BTreeSet};
 use std::fs;
 use std::io::{self, Read};
@@ -418,10 +419,10 @@ pub fn scan_repo_controlled_with_work(
                 }
             };
             let path = entry.path();
-            if should_skip_path(&root, path, &options) {
+            let Some(relative) = indexable_relative_path(&root, path, &options) else {
                 return skip_entry_state(&entry);
-            }
-            match scanned_node(&root, path, &options, &budget) {
+            };
+            match scanned_node(path, relative, entry.file_type(), &options, &budget) {
                 Ok(Some(node)) => {
                     if let Ok(mut guard) = nodes.lock() {
                         guard.push(node);
@@ -534,11 +535,16 @@ pub fn scan_path_with_policy_controlled(
         control.check(IndexWorkStage::ScanFinalization)?;
         return Ok(None);
     }
-    if gitignore_excludes_path(root, &absolute)? || should_skip_path(root, &absolute, options) {
+    let relative = if gitignore_excludes_path(root, &absolute)? {
+        None
+    } else {
+        indexable_relative_path(root, &absolute, options)
+    };
+    let Some(relative) = relative else {
         control.check(IndexWorkStage::ScanFinalization)?;
         return Ok(None);
-    }
-    let node = scanned_node(root, &absolute, options, &budget)?;
+    };
+    let node = scanned_node(&absolute, relative, None, options, &budget)?;
     control.check(IndexWorkStage::ScanFinalization)?;
     Ok(node)
 }
@@ -1130,13 +1136,25 @@ fn skip_entry_state(entry: &DirEntry) -> WalkState {
 }
 
 /// Convert one walker entry into an indexed node.
+///
+/// Walker entries pass their unfollowed file type so that only regular files need a
+/// metadata read; single-path callers pass `None` and always read metadata.
 fn scanned_node(
-    root: &Path,
     path: &Path,
+    relative: String,
+    file_type: Option<fs::FileType>,
     options: &ScanOptions,
     budget: &ScanBudget,
 ) -> FsResult<Option<Node>> {
     budget.control.check(IndexWorkStage::SourceMetadata)?;
+    if let Some(file_type) = file_type {
+        if file_type.is_dir() {
+            return Ok(Some(folder_node(relative)));
+        }
+        if !file_type.is_file() {
+            return Ok(None);
+        }
+    }
     let metadata = fs::symlink_metadata(path).map_err(|source| FsError::Io {
         path: path.to_path_buf(),
         source,
@@ -1145,10 +1163,10 @@ fn scanned_node(
         return Ok(None);
     }
     if metadata.is_dir() {
-        return folder_node(root, path).map(Some);
+        return Ok(Some(folder_node(relative)));
     }
     if metadata.is_file() {
-        return file_node(root, path, &metadata, options, budget).map(Some);
+        return file_node(path, relative, &metadata, options, budget).map(Some);
     }
     Ok(None)
 }
@@ -1173,15 +1191,12 @@ fn state_error(root: &Path, message: &str) -> FsError {
     }
 }
 
-/// Return whether a repository-relative path should be skipped.
-fn should_skip_path(root: &Path, path: &Path, options: &ScanOptions) -> bool {
-    match normalize_repo_path(root, path) {
-        Ok(relative) => {
-            relative != "."
-                && (options.excludes_relative_path(&relative) || is_reserved_metadata_file(path))
-        }
-        Err(_) => true,
-    }
+/// Return the repository-relative path of an entry, or `None` when scan policy skips it.
+fn indexable_relative_path(root: &Path, path: &Path, options: &ScanOptions) -> Option<String> {
+    let relative = normalize_repo_path(root, path).ok()?;
+    let skipped = relative != "."
+        && (options.excludes_relative_path(&relative) || is_reserved_metadata_file(path));
+    (!skipped).then_some(relative)
 }
 
 /// Return whether a repository-relative slash path contains an excluded directory.
@@ -1201,8 +1216,8 @@ fn has_excluded_directory_component(relative_path: &str, options: &ScanOptions)
 /// Return whether a repository-relative slash path starts with an excluded prefix.
 fn has_excluded_path_prefix(relative_path: &str, options: &ScanOptions) -> bool {
     options.exclude_path_prefixes.iter().any(|prefix| {
-        let prefix = prefix.replace('\\', "/");
-        let prefix = prefix.trim_matches('/');
+        let prefix = slash_trimmed(prefix);
+        let prefix: &str = &prefix;
         !prefix.is_empty()
             && (relative_path == prefix
                 || relative_path
@@ -1213,9 +1228,17 @@ fn has_excluded_path_prefix(relative_path: &str, options: &ScanOptions) -> bool
 
 /// Return whether a ProjectAtlas-local metadata path should remain indexable.
 fn is_indexed_projectatlas_input(relative_path: &str) -> bool {
-    let normalized = relative_path.replace('\\', "/");
-    let normalized = normalized.trim_matches('/');
-    INDEXED_PROJECTATLAS_INPUT_PATHS.contains(&normalized)
+    let normalized = slash_trimmed(relative_path);
+    INDEXED_PROJECTATLAS_INPUT_PATHS.contains(&&*normalized)
+}
+
+/// Return a slash path without edge separators, allocating only to rewrite backslashes.
+fn slash_trimmed(value: &str) -> Cow<'_, str> {
+    if value.contains('\\') {
+        Cow::Owned(value.replace('\\', "/").trim_matches('/').to_string())
+    } else {
+        Cow::Borrowed(value.trim_matches('/'))
+    }
 }
 
 /// Return whether a path is a reserved metadata file.
@@ -1227,9 +1250,8 @@ fn is_reserved_metadata_file(path: &Path) -> bool {
 }
 
 /// Build a folder node from filesystem metadata.
-fn folder_node(root: &Path, path: &Path) -> FsResult<Node> {
-    let normalized = normalize_repo_path(root, path)?;
-    Ok(Node {
+fn folder_node(normalized: String) -> Node {
+    Node {
         parent_path: normalized_parent(&normalized),
         path: normalized,
         kind: NodeKind::Folder,
@@ -1238,18 +1260,17 @@ fn folder_node(root: &Path, path: &Path) -> FsResult<Node> {
         size_bytes: None,
         mtime_ns: None,
         content_hash: None,
-    })
+    }
 }
 
 /// Build a file node from filesystem metadata and content hash.
 fn file_node(
-    root: &Path,
     path: &Path,
+    normalized: String,
     metadata: &fs::Metadata,
     options: &ScanOptions,
     budget: &ScanBudget,
 ) -> FsResult<Node> {
-    let normalized = normalize_repo_path(root, path)?;
     let extension = normalized_extension(path);
     budget.control.check(IndexWorkStage::SourceHash)?;
     let explicit_override = explicit_language_override(
@@ -2,15 +2,17 @@
 //! Cargo-adjacent lint gate for `ProjectAtlas`-specific Rust contracts.
 
 use proc_macro2::{TokenStream, TokenTree};
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use std::collections::BTreeMap;
 use std::env;
 use std::ffi::OsString;
 use std::fmt::{self, Display};
 use std::fs;
-use std::io::{self, Write};
+use std::io::{self, BufRead, BufReader, BufWriter, Write};
+use std::num::NonZeroUsize;
 use std::path::{Path, PathBuf};
-use std::process::{Command, ExitCode};
+use std::process::{Command, ExitCode, Stdio};
+use std::thread;
 use syn::parse::Parser;
 use syn::punctuated::Punctuated;
 use syn::visit::{self, Visit};
@@ -220,8 +222,9 @@ fn main() -> ExitCode {
     match run(env::args_os().skip(1), &current_dir()) {
         Ok(()) => ExitCode::from(EXIT_OK),
         Err(LintError::Violations(violations)) => {
-            let mut stderr = io::stderr().lock();
-            if write_violations(&mut stderr, &violations).is_err() {
+            // Stderr is unbuffered; batch the report so each finding is not its own write.
+            let mut stderr = BufWriter::new(io::stderr().lock());
+            if write_violations(&mut stderr, &violations).is_err() || stderr.flush().is_err() {
                 return ExitCode::from(EXIT_FAILURE);
             }
             ExitCode::from(EXIT_FAILURE)
@@ -286,29 +289,20 @@ fn help() -> Result<(), LintError> {
 
 /// Run all strict string-contract rules from a workspace root.
 fn run_strict_strings(root: &Path) -> Result<(), LintError> {
+    let files = parse_rule_sources(root)?;
     let mut violations = Vec::new();
     for rule in STRICT_STRING_RULES {
         for relative_path in rule.paths {
-            let path = root.join(relative_path);
-            let source = fs::read_to_string(&path).map_err(|source| LintError::ReadFile {
-                path: (*relative_path).to_string(),
-                source,
-            })?;
-            violations.extend(lint_source(relative_path, rule, &source)?);
+            if let Some(file) = files.get(relative_path) {
+                violations.extend(lint_file(relative_path, rule, file));
+            }
         }
     }
     for rule in REPEATED_PATH_JOIN_RULES {
         for relative_path in rule.paths {
-            let path = root.join(relative_path);
-            let source = fs::read_to_string(&path).map_err(|source| LintError::ReadFile {
-                path: (*relative_path).to_string(),
-                source,
-            })?;
-            violations.extend(lint_repeated_path_join_literals(
-                relative_path,
-                rule,
-                &source,
-            )?);
+            if let Some(file) = files.get(relative_path) {
+                violations.extend(lint_repeated_path_join_file(relative_path, rule, file));
+            }
         }
     }
     violations.extend(lint_repository_private_paths(root)?);
@@ -331,21 +325,193 @@ fn lint_repository_private_paths(root: &Path) -> Result<Vec<StringLiteralViolati
         return Err(LintError::GitFileListFailed(output.status.code()));
     }
     let rules = private_path_rules()?;
-    let mut violations = Vec::new();
-    for raw_path in output
+    let relative_paths = output
         .stdout
         .split(|byte| *byte == 0)
         .filter(|path| !path.is_empty())
-    {
-        let relative_path = std::str::from_utf8(raw_path).map_err(LintError::NonUtf8GitPath)?;
+        .map(std::str::from_utf8)
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(LintError::NonUtf8GitPath)?;
+    let mut violations = lint_tracked_private_paths(root, &relative_paths, &rules)?;
+
+    let dirty = Command::new("git")
+        .args(["diff", "--name-only", "-z", "--no-renames", "HEAD", "--"])
+        .current_dir(root)
+        .output()
+        .map_err(LintError::ListGitFiles)?;
+    if !dirty.status.success() {
+        return Err(LintError::GitFileListFailed(dirty.status.code()));
+    }
+    let dirty_paths = dirty
+        .stdout
+        .split(|byte| *byte == 0)
+        .filter(|path| !path.is_empty())
+        .map(std::str::from_utf8)
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(LintError::NonUtf8GitPath)?;
+    for (relative_path, committed) in dirty_paths.iter().zip(committed_blobs(root, &dirty_paths)?) {
+        let Some(bytes) = committed else {
+            continue;
+        };
+        let Ok(source) = String::from_utf8(bytes) else {
+            continue;
+        };
+        violations.extend(lint_private_path_source(relative_path, &source, &rules));
+    }
+    Ok(violations)
+}
+
+/// Read committed `HEAD` blobs for many paths through one `git cat-file --batch` process.
+fn committed_blobs(
+    root: &Path,
+    relative_paths: &[&str],
+) -> Result<Vec<Option<Vec<u8>>>, LintError> {
+    // The batch protocol is line-delimited, so paths containing a newline are read one by one.
+    let batched = relative_paths
+        .iter()
+        .copied()
+        .filter(|path| !path.contains('\n'))
+        .collect::<Vec<_>>();
+    let mut blobs = if batched.is_empty() {
+        Vec::new()
+    } else {
+        committed_blob_batch(root, &batched)?
+    }
+    .into_iter();
+    relative_paths
+        .iter()
+        .map(|relative_path| {
+            if relative_path.contains('\n') {
+                committed_blob(root, relative_path)
+            } else {
+                Ok(blobs.next().flatten())
+            }
+        })
+        .collect()
+}
+
+/// Stream `HEAD:<path>` requests into `git cat-file --batch` and read the answers in order.
+fn committed_blob_batch(
+    root: &Path,
+    relative_paths: &[&str],
+) -> Result<Vec<Option<Vec<u8>>>, LintError> {
+    let mut child = Command::new("git")
+        .args(["cat-file", "--batch"])
+        .current_dir(root)
+        .stdin(Stdio::piped())
+        .stdout(Stdio::piped())
+        .spawn()
+        .map_err(LintError::ListGitFiles)?;
+    let (Some(stdin), Some(stdout)) = (child.stdin.take(), child.stdout.take()) else {
+        return Err(LintError::Io(io::Error::other(
+            "git cat-file --batch pipes are unavailable",
+        )));
+    };
+    let blobs = thread::scope(|scope| -> io::Result<Vec<Option<Vec<u8>>>> {
+        // Requests are written on their own thread so a full stdout pipe cannot stall git.
+        let writer = scope.spawn(move || -> io::Result<()> {
+            let mut stdin = BufWriter::new(stdin);
+            for relative_path in relative_paths {
+                writeln!(stdin, "HEAD:{relative_path}")?;
+            }
+            stdin.flush()
+        });
+        let mut reader = BufReader::new(stdout);
+        let mut blobs = Vec::with_capacity(relative_paths.len());
+        for _ in relative_paths {
+            blobs.push(read_batch_blob(&mut reader)?);
+        }
+        match writer.join() {
+            Ok(written) => written?,
+            Err(payload) => std::panic::resume_unwind(payload),
+        }
+        Ok(blobs)
+    })
+    .map_err(LintError::Io)?;
+    let status = child.wait().map_err(LintError::Io)?;
+    if !status.success() {
+        return Err(LintError::GitFileListFailed(status.code()));
+    }
+    Ok(blobs)
+}
+
+/// Read one `git cat-file --batch` answer, returning `None` for missing or non-blob objects.
+fn read_batch_blob(reader: &mut impl BufRead) -> io::Result<Option<Vec<u8>>> {
+    let mut header = String::new();
+    if reader.read_line(&mut header)? == 0 {
+        return Err(io::Error::new(
+            io::ErrorKind::UnexpectedEof,
+            "git cat-file --batch ended before every object was answered",
+        ));
+    }
+    // Found objects answer `<oid> <type> <size>`; misses end in a word such as `missing`.
+    let header = header.trim_end_matches('\n');
+    let Some((object, size)) = header.rsplit_once(' ') else {
+        return Ok(None);
+    };
+    let Ok(size) = size.parse::<usize>() else {
+        return Ok(None);
+    };
+    let mut content = vec![0; size + 1];
+    reader.read_exact(&mut content)?;
+    content.pop();
+    Ok(object.ends_with(" blob").then_some(content))
+}
+
+/// Read one committed `HEAD` blob with a dedicated `git cat-file` process.
+fn committed_blob(root: &Path, relative_path: &str) -> Result<Option<Vec<u8>>, LintError> {
+    let committed = Command::new("git")
+        .args(["cat-file", "blob"])
+        .arg(format!("HEAD:{relative_path}"))
+        .current_dir(root)
+        .output()
+        .map_err(LintError::ListGitFiles)?;
+    Ok(committed.status.success().then_some(committed.stdout))
+}
+
+/// Scan tracked worktree files on all available cores, keeping `git ls-files` order.
+fn lint_tracked_private_paths(
+    root: &Path,
+    relative_paths: &[&str],
+    rules: &PrivatePathRules,
+) -> Result<Vec<StringLiteralViolation>, LintError> {
+    let workers = thread::available_parallelism()
+        .map_or(1, NonZeroUsize::get)
+        .min(relative_paths.len())
+        .max(1);
+    let chunk_size = relative_paths.len().div_ceil(workers).max(1);
+    thread::scope(|scope| {
+        let mut handles = Vec::with_capacity(workers);
+        for chunk in relative_paths.chunks(chunk_size) {
+            handles.push(scope.spawn(move || lint_tracked_private_path_chunk(root, chunk, rules)));
+        }
+        let mut violations = Vec::new();
+        for handle in handles {
+            match handle.join() {
+                Ok(chunk_violations) => violations.extend(chunk_violations?),
+                Err(payload) => std::panic::resume_unwind(payload),
+            }
+        }
+        Ok(violations)
+    })
+}
+
+/// Scan one contiguous slice of tracked worktree files for machine-specific paths.
+fn lint_tracked_private_path_chunk(
+    root: &Path,
+    relative_paths: &[&str],
+    rules: &PrivatePathRules,
+) -> Result<Vec<StringLiteralViolation>, LintError> {
+    let mut violations = Vec::new();
+    for relative_path in relative_paths {
         let path = root.join(relative_path);
         let metadata = fs::symlink_metadata(&path).map_err(|source| LintError::ReadFile {
-            path: relative_path.to_string(),
+            path: (*relative_path).to_string(),
             source,
         })?;
         let source = if metadata.file_type().is_symlink() {
             let target = fs::read_link(&path).map_err(|source| LintError::ReadFile {
-                path: relative_path.to_string(),
+                path: (*relative_path).to_string(),
                 source,
             })?;
             let Ok(target) = target.into_os_string().into_string() else {
@@ -354,7 +520,7 @@ fn lint_repository_private_paths(root: &Path) -> Result<Vec<StringLiteralViolati
             target
         } else {
             let bytes = fs::read(&path).map_err(|source| LintError::ReadFile {
-                path: relative_path.to_string(),
+                path: (*relative_path).to_string(),
                 source,
             })?;
             let Ok(source) = String::from_utf8(bytes) else {
@@ -362,60 +528,51 @@ fn lint_repository_private_paths(root: &Path) -> Result<Vec<StringLiteralViolati
             };
             source
         };
-        violations.extend(lint_private_path_source(relative_path, &source, &rules));
-    }
-
-    let dirty = Command::new("git")
-        .args(["diff", "--name-only", "-z", "--no-renames", "HEAD", "--"])
-        .current_dir(root)
-        .output()
-        .map_err(LintError::ListGitFiles)?;
-    if !dirty.status.success() {
-        return Err(LintError::GitFileListFailed(dirty.status.code()));
-    }
-    for raw_path in dirty
-        .stdout
-        .split(|byte| *byte == 0)
-        .filter(|path| !path.is_empty())
-    {
-        let relative_path = std::str::from_utf8(raw_path).map_err(LintError::NonUtf8GitPath)?;
-        let committed = Command::new("git")
-            .args(["cat-file", "blob"])
-            .arg(format!("HEAD:{relative_path}"))
-            .current_dir(root)
-            .output()
-            .map_err(LintError::ListGitFiles)?;
-        let Ok(source) = String::from_utf8(committed.stdout) else {
-            continue;
-        };
-        if committed.status.success() {
-            violations.extend(lint_private_path_source(relative_path, &source, &rules));
-        }
+        violations.extend(lint_private_path_source(relative_path, &source, rules));
     }
     Ok(violations)
 }
 
+/// Compiled repository-private path rules.
+struct PrivatePathRules {
+    /// Whole-source prefilter that lets clean files skip the per-line scan.
+    any_line: RegexSet,
+    /// Per-line rules that locate each finding.
+    lines: Vec<Regex>,
+}
+
 /// Compile the fixed repository-private path rules.
-fn private_path_rules() -> Result<Vec<Regex>, LintError> {
-    PRIVATE_PATH_PATTERNS
+fn private_path_rules() -> Result<PrivatePathRules, LintError> {
+    // Multi-line CRLF mode lets `^`/`$` match at every line boundary `str::lines` would split on.
+    let any_line = RegexSet::new(
+        PRIVATE_PATH_PATTERNS
+            .iter()
+            .map(|pattern| format!("(?mR){pattern}")),
+    )
+    .map_err(LintError::InvalidPrivatePathRule)?;
+    let lines = PRIVATE_PATH_PATTERNS
         .iter()
         .map(|pattern| Regex::new(pattern))
         .collect::<Result<Vec<_>, _>>()
-        .map_err(LintError::InvalidPrivatePathRule)
+        .map_err(LintError::InvalidPrivatePathRule)?;
+    Ok(PrivatePathRules { any_line, lines })
 }
 
 /// Return redacted path findings without retaining matched source text.
 fn lint_private_path_source(
     relative_path: &str,
     source: &str,
-    rules: &[Regex],
+    rules: &PrivatePathRules,
 ) -> Vec<StringLiteralViolation> {
+    if !rules.any_line.is_match(source) {
+        return Vec::new();
+    }
     source
         .lines()
         .enumerate()
         .filter(|(_, line)| {
             !line.contains(PRIVATE_PATH_FIXTURE_MARKER)
-                && rules.iter().any(|rule| rule.is_match(line))
+                && rules.lines.iter().any(|rule| rule.is_match(line))
         })
         .map(|(line, _)| StringLiteralViolation {
             path: relative_path.to_string(),
@@ -428,47 +585,90 @@ fn lint_private_path_source(
         .collect()
 }
 
+/// Read and parse every rule-protected source once, even when several rules share a file.
+fn parse_rule_sources(root: &Path) -> Result<BTreeMap<&'static str, syn::File>, LintError> {
+    let relative_paths = STRICT_STRING_RULES
+        .iter()
+        .flat_map(|rule| rule.paths)
+        .chain(REPEATED_PATH_JOIN_RULES.iter().flat_map(|rule| rule.paths));
+    let mut files = BTreeMap::new();
+    for relative_path in relative_paths {
+        if files.contains_key(relative_path) {
+            continue;
+        }
+        let source =
+            fs::read_to_string(root.join(relative_path)).map_err(|source| LintError::ReadFile {
+                path: (*relative_path).to_string(),
+                source,
+            })?;
+        files.insert(*relative_path, parse_source(relative_path, &source)?);
+    }
+    Ok(files)
+}
+
+/// Parse one Rust source file into a syntax tree.
+fn parse_source(relative_path: &str, source: &str) -> Result<syn::File, LintError> {
+    syn::parse_file(source).map_err(|source| LintError::Parse {
+        path: relative_path.to_string(),
+        source,
+    })
+}
+
 /// Parse one Rust source file and return strict string-contract violations.
+#[cfg(test)]
 fn lint_source(
     relative_path: &str,
     rule: &'static StringLiteralRule,
     source: &str,
 ) -> Result<Vec<StringLiteralViolation>, LintError> {
-    let file = syn::parse_file(source).map_err(|source| LintError::Parse {
-        path: relative_path.to_string(),
-        source,
-    })?;
+    let file = parse_source(relative_path, source)?;
+    Ok(lint_file(relative_path, rule, &file))
+}
+
+/// Return strict string-contract violations for one parsed Rust source file.
+fn lint_file(
+    relative_path: &str,
+    rule: &'static StringLiteralRule,
+    file: &syn::File,
+) -> Vec<StringLiteralViolation> {
     let mut visitor = StringLiteralVisitor {
         relative_path,
         rule,
         centralized_depth: 0,
         violations: Vec::new(),
     };
-    visitor.visit_file(&file);
-    Ok(visitor.violations)
+    visitor.visit_file(file);
+    visitor.violations
 }
 
 /// Parse one Rust source file and return repeated path-join literal violations.
+#[cfg(test)]
 fn lint_repeated_path_join_literals(
     relative_path: &str,
     rule: &'static PathJoinLiteralRule,
     source: &str,
 ) -> Result<Vec<StringLiteralViolation>, LintError> {
-    let file = syn::parse_file(source).map_err(|source| LintError::Parse {
-        path: relative_path.to_string(),
-        source,
-    })?;
+    let file = parse_source(relative_path, source)?;
+    Ok(lint_repeated_path_join_file(relative_path, rule, &file))
+}
+
+/// Return repeated path-join literal violations for one parsed Rust source file.
+fn lint_repeated_path_join_file(
+    relative_path: &str,
+    rule: &'static PathJoinLiteralRule,
+    file: &syn::File,
+) -> Vec<StringLiteralViolation> {
     let mut visitor = PathJoinLiteralVisitor {
         occurrences: Vec::new(),
     };
-    visitor.visit_file(&file);
+    visitor.visit_file(file);
 
     let mut counts: BTreeMap<String, usize> = BTreeMap::new();
     for occurrence in &visitor.occurrences {
         *counts.entry(occurrence.literal.clone()).or_default() += 1;
     }
 
-    let violations = visitor
+    visitor
         .occurrences
         .into_iter()
         .filter(|occurrence| {
@@ -488,8 +688,7 @@ fn lint_repeated_path_join_literals(
             literal: occurrence.literal,
             description: rule.description,
         })
-        .collect();
-    Ok(violations)
+        .collect()
 }
 
 /// Path-scoped rule for protected exact string literals.
@@ -668,7 +867,7 @@ impl StringLiteralVisitor<'_> {
             match token {
                 TokenTree::Group(group) => self.scan_macro_tokens(group.stream()),
                 TokenTree::Literal(literal) => {
-                    if let Ok(literal) = syn::parse_str::<LitStr>(&literal.to_string()) {
+                    if let Lit::Str(literal) = Lit::new(literal) {
                         self.record_literal(&literal);
                     }
                 }
@@ -325,6 +325,7 @@ def build_command(
             "server are unavailable and must not be invoked. Navigate with ordinary "
             "read-only source tools."
         )
+    fixture_root = str(fixture.resolve())
     arguments = [
         str(candidate_path(common["executable"])),
         "exec",
@@ -338,7 +339,7 @@ def build_command(
         "--sandbox",
         str(common["sandbox"]),
         "--cd",
-        str(fixture.resolve()),
+        fixture_root,
         "--model",
         str(common["model"]),
         "-c",
@@ -351,7 +352,7 @@ def build_command(
     if arm_name != "plain":
         runtime = candidate_path(arm["runtime"])
         replacements = {
-            "fixture": str(fixture.resolve()),
+            "fixture": fixture_root,
             "db": str((fixture / ".projectatlas/projectatlas.db").resolve()),
             "config": str((fixture / ".projectatlas/config.toml").resolve()),
         }
@@ -370,7 +371,7 @@ def build_command(
                 "mcp_servers.projectatlas.default_tools_approval_mode="
                 f"{toml_string(str(common['mcp_approval']['default_mode']))}",
                 "-c",
-                f"mcp_servers.projectatlas.cwd={toml_string(str(fixture.resolve()))}",
+                f"mcp_servers.projectatlas.cwd={toml_string(fixture_root)}",
             ]
         )
         for tool_name in common["mcp_approval"]["read_only_tools"]:
@@ -421,14 +422,16 @@ def source_state(root: Path) -> dict[str, Any]:
             "sha256": digest.hexdigest(),
             "status": status.decode("utf-8", errors="replace").replace("\0", "\n"),
         }
+    excluded = {".git", ".projectatlas"}
+    paths = []
+    for current, directories, names in os.walk(root):
+        directories[:] = [name for name in directories if name not in excluded]
+        paths.extend(Path(current) / name for name in names if name not in excluded)
     files = []
-    for path in sorted(root.rglob("*")):
-        relative = path.relative_to(root)
-        if not path.is_file() or any(
-            part in {".git", ".projectatlas"} for part in relative.parts
-        ):
+    for path in sorted(paths):
+        if not path.is_file():
             continue
-        normalized = relative.as_posix()
+        normalized = path.relative_to(root).as_posix()
         digest.update(normalized.encode("utf-8"))
         digest.update(path.read_bytes())
         files.append(normalized)
@@ -97,6 +97,7 @@ def measurement_input_errors(
     if revision != "HEAD" and not re.fullmatch(r"[0-9a-f]{40}", revision):
         return ["measurement input revision is malformed"]
     errors = []
+    resolved_root = root.resolve()
     for relative in required_paths:
         expected = locked.get(relative)
         if (
@@ -108,7 +109,7 @@ def measurement_input_errors(
             continue
         path = (root / relative).resolve()
         try:
-            path.relative_to(root.resolve())
+            path.relative_to(resolved_root)
         except ValueError:
             errors.append(f"measurement input escapes the repository: {relative}")
             continue